@@ -49,7 +49,8 @@ PACKAGES=(
 
 # Helpers
 log() {
-  echo "[$(date +'%Y-%m-%d %H:%M:%S')] $*" | tee -a "$LOG"
+  # printf's %(...)T formats the time in-shell instead of forking date(1) per line
+  printf '[%(%Y-%m-%d %H:%M:%S)T] %s\n' -1 "$*" | tee -a "$LOG"
 }
 die() { echo "ERROR: $*" | tee -a "$LOG" >&2; exit 1; }
 
@@ -150,7 +151,16 @@ try_install_pkg() {
 }
 
 main_install_loop() {
-  log "Beginning package installation loop. This can take some time."
+  log "Beginning package installation. This can take some time."
+
+  # One apt transaction resolves dependencies and runs triggers once for everything;
+  # only fall back to the per-package loop (with its Kali retries) if it fails.
+  if apt-get -y install "${PACKAGES[@]}"; then
+    log "Installed all ${#PACKAGES[@]} packages in a single apt transaction."
+    return 0
+  fi
+
+  log "Batch install failed. Falling back to installing packages one by one."
   local installed=0 failed=0
   for pkg in "${PACKAGES[@]}"; do
     if try_install_pkg "$pkg"; then
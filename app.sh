@@ -1,30 +1,42 @@
 #!/usr/bin/env bash
-# Install Brave (Nightly)
-curl -fsS https://dl.brave.com/install.sh | CHANNEL=nightly sh
-# Download latest Telegram tarball automatically
-url=$(wget -qO- https://telegram.org/dl/desktop/linux | grep -oP 'https://telegram.org/dl/desktop/linux/tsetup\.\d+\.\d+\.\d+\.tar\.xz' | head -n 1)
-echo "Downloading: $url"
-wget -q "$url" -O tsetup_latest.tar.xz
+# Start the installer downloads in parallel; dpkg/apt steps below stay serial
+# The Telegram link redirects straight to the latest tarball, so no page scraping is needed
+echo "Downloading Telegram, Brave, ProtonVPN, RustScan and VS Code..."
+dl=$(mktemp -d -p /dev/shm startup.XXXXXX 2>/dev/null || mktemp -d)  # RAM-backed when possible
+chmod 755 "$dl"
+trap 'rm -rf "$dl"' EXIT
 sudo rm -rf /bin/Telegram
-sudo tar -xf tsetup_latest.tar.xz -C /bin
+wget -qO- https://telegram.org/dl/desktop/linux | sudo tar -xJf - -C /bin & tg_pid=$!  # stream into tar, no tarball on disk
+wget -q --timeout=30 --tries=5 --retry-connrefused https://brave-browser-apt-nightly.s3.brave.com/brave-browser-nightly-archive-keyring.gpg -O "$dl/brave-nightly-keyring.gpg" & brave_pid=$!
+wget -q --timeout=30 --tries=5 --retry-connrefused https://repo.protonvpn.com/debian/dists/stable/main/binary-all/protonvpn-stable-release_1.0.8_all.deb -O "$dl/protonvpn-release.deb" & proton_pid=$!
+wget -q --timeout=30 --tries=5 --retry-connrefused https://github.com/RustScan/RustScan/releases/download/2.2.3/rustscan_2.2.3_amd64.deb -O "$dl/rustscan_2.2.3_amd64.deb" & rustscan_pid=$!
+wget -q --timeout=30 --tries=5 --retry-connrefused "https://code.visualstudio.com/sha/download?build=stable&os=linux-deb-x64" -O "$dl/code.deb" & code_pid=$!
+# Add the Brave Nightly and ProtonVPN repos and refresh apt in the background while Telegram finishes
+pkgs=(proton-vpn-gnome-desktop libayatana-appindicator3-1 gir1.2-ayatanaappindicator3-0.1 gnome-shell-extension-appindicator)
+# Only trust the Brave repo if its keyring actually downloaded
+if wait $brave_pid; then
+    sudo install -m 644 "$dl/brave-nightly-keyring.gpg" /usr/share/keyrings/brave-browser-nightly-archive-keyring.gpg
+    echo "deb [signed-by=/usr/share/keyrings/brave-browser-nightly-archive-keyring.gpg] https://brave-browser-apt-nightly.s3.brave.com/ stable main" | sudo tee /etc/apt/sources.list.d/brave-browser-nightly.list >/dev/null
+    pkgs+=(brave-browser-nightly)
+else
+    echo "Brave keyring download failed, skipping Brave."
+fi
+wait $proton_pid
+sudo dpkg -i "$dl/protonvpn-release.deb"
+sudo apt update & apt_pid=$!
+# Install Telegram
+wait $tg_pid
 cd /bin/Telegram
 sudo chmod +x Telegram
 ./Telegram &
-# Install ProtonVPN
-wget https://repo.protonvpn.com/debian/dists/stable/main/binary-all/protonvpn-stable-release_1.0.8_all.deb -O /tmp/protonvpn-release.deb
-sudo dpkg -i /tmp/protonvpn-release.deb
-sudo apt update
-sudo apt install -y proton-vpn-gnome-desktop
-sudo apt install -y libayatana-appindicator3-1 gir1.2-ayatanaappindicator3-0.1 gnome-shell-extension-appindicator
+# Install Brave, ProtonVPN, RustScan and VS Code in one apt transaction (local .debs included)
+# Only add the local .debs that actually downloaded (a failed wget -O leaves an empty file)
+if wait $rustscan_pid; then pkgs+=("$dl/rustscan_2.2.3_amd64.deb"); else echo "RustScan download failed, skipping."; fi
+if wait $code_pid; then pkgs+=("$dl/code.deb"); else echo "VS Code download failed, skipping."; fi
+wait $apt_pid
+# If apt rejects the batch, fall back to installing each package on its own
+sudo apt install -y "${pkgs[@]}" || for pkg in "${pkgs[@]}"; do sudo apt install -y "$pkg"; done
 protonvpn-app &
-# Install RustScan
-wget https://github.com/RustScan/RustScan/releases/download/2.2.3/rustscan_2.2.3_amd64.deb
-sudo dpkg -i rustscan_2.2.3_amd64.deb
-sudo apt-get install -f  # Fix any missing dependencies
 # Increase file descriptor limit
 ulimit -n 5000
-# Download the latest VS Code .deb package
-wget -q "https://code.visualstudio.com/sha/download?build=stable&os=linux-deb-x64" -O code.deb
-sudo dpkg -i code.deb || sudo apt-get install -f -y
-rm -f code.deb
 code &
@@ -1,36 +1,78 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-# Helper: Safely remove any existing file or directory
+# Helper: Safely remove any existing file or directory (rm -f already ignores missing paths)
 safe_rm() {
-    if [ -e "$1" ]; then
-        rm -rf "$1"
-    fi
+    rm -rf "$1"
 }
 
-# 7️⃣ Installing Telegram...
-echo "📥 Downloading Telegram from https://telegram.org/dl/desktop/linux..."
-
-safe_rm tsetup.tar.xz
-wget -q https://telegram.org/dl/desktop/linux -O tsetup.tar.xz
+# Helper: Download a file, retrying with full-jitter exponential backoff
+# (sleep a random 0..min(30, 2^attempt)s) so many machines don't retry in lockstep;
+# wget itself makes a single try per attempt, so this is the only retry loop
+fetch() {
+    local url="$1" out="$2" attempt cap
+    for attempt in 1 2 3 4 5; do
+        if wget -q --tries=1 --timeout=30 "$url" -O "$out"; then
+            return 0
+        fi
+        if [ "$attempt" -lt 5 ]; then
+            cap=$(( 1 << attempt ))
+            if [ "$cap" -gt 30 ]; then cap=30; fi
+            sleep "$(( RANDOM % (cap + 1) ))"
+        fi
+    done
+    return 1
+}
 
-echo "📦 Extracting Telegram..."
-sudo mkdir -p /opt/Telegram
-safe_rm /opt/Telegram
-sudo mkdir -p /opt/Telegram
-sudo tar -xf tsetup.tar.xz -C /opt/Telegram --strip-components=1
+# Helper: Start a download in the background and remember its PID
+declare -A DL_PIDS=()
+fetch_bg() {
+    local name="$1" url="$2" out="$3"
+    fetch "$url" "$out" &
+    DL_PIDS[$name]=$!
+}
 
-## Make it executable
-sudo chmod +x /opt/Telegram/Telegram
+# Helper: Wait for a background download (returns the job's status; 0 if it was skipped)
+fetch_wait() {
+    if [ -n "${DL_PIDS[$1]:-}" ]; then
+        wait "${DL_PIDS[$1]}"
+    fi
+}
 
-# Add symlink if not present
-if ! command -v telegram-desktop >/dev/null 2>&1; then
-    sudo ln -sf /opt/Telegram/Telegram /usr/local/bin/telegram-desktop
-fi
+# Helper: True if a package is already installed (STARTUP_FORCE=1 reinstalls everything)
+is_installed() {
+    [ "${STARTUP_FORCE:-0}" != 1 ] &&
+        [ "$(dpkg-query -W -f='${Status}' "$1" 2>/dev/null)" = "install ok installed" ]
+}
 
-#echo "🚀 Launching Telegram..."
-/opt/Telegram/Telegram >/dev/null 2>&1 &
+# Downloads go to a RAM-backed scratch dir when /dev/shm is available; it is removed on exit
+DL_DIR=$(mktemp -d -p /dev/shm startup.XXXXXX 2>/dev/null || mktemp -d)
+chmod 755 "$DL_DIR"  # apt's _apt user must be able to read the local .debs
+trap 'rm -rf "$DL_DIR"' EXIT
 
+# 0️⃣ Prefetch all installers in parallel, behind the GRUB/wallpaper/GNOME steps;
+#    the dpkg/apt steps below stay serial
+#    Anything already installed is skipped, so re-runs only re-apply the settings.
+echo "📥 Prefetching Telegram, Brave, ProtonVPN, RustScan and VS Code..."
+# A marker written after a complete extraction (not just -x on the binary), so a
+# download cut off mid-stream is repaired on the next run
+if [ -f /opt/Telegram/.startup-installed ] && [ "${STARTUP_FORCE:-0}" != 1 ]; then
+    echo "✅ Telegram already installed (it updates itself), skipping download."
+else
+    safe_rm /opt/Telegram
+    sudo mkdir -p /opt/Telegram
+    # Telegram is piped straight into tar, so the archive is never written to disk
+    wget -qO- https://telegram.org/dl/desktop/linux | sudo tar -xJf - -C /opt/Telegram --strip-components=1 &
+    DL_PIDS[telegram]=$!
+fi
+is_installed brave-browser-nightly \
+    || fetch_bg brave https://brave-browser-apt-nightly.s3.brave.com/brave-browser-nightly-archive-keyring.gpg "$DL_DIR/brave-nightly-keyring.gpg"
+is_installed protonvpn-stable-release \
+    || fetch_bg protonvpn https://repo.protonvpn.com/debian/dists/stable/main/binary-all/protonvpn-stable-release_1.0.8_all.deb "$DL_DIR/protonvpn.deb"
+is_installed rustscan \
+    || fetch_bg rustscan https://github.com/RustScan/RustScan/releases/download/2.2.3/rustscan_2.2.3_amd64.deb "$DL_DIR/rustscan_2.2.3_amd64.deb"
+is_installed code \
+    || fetch_bg vscode "https://code.visualstudio.com/sha/download?build=stable&os=linux-deb-x64" "$DL_DIR/code.deb"
 
 ##
 set -euo pipefail
@@ -48,6 +90,11 @@ gset() {
     sudo -u "$REAL_USER" DBUS_SESSION_BUS_ADDRESS="$DBUS_SESSION_BUS_ADDRESS" gsettings "$@"
 }
 
+# Helper: Apply a dconf keyfile from stdin as real user (one process for many keys)
+dconf_load() {
+    sudo -u "$REAL_USER" DBUS_SESSION_BUS_ADDRESS="$DBUS_SESSION_BUS_ADDRESS" dconf load /
+}
+
 # Helper: Safely remove any existing file or directory
 safe_rm() {
     if [ -e "$1" ]; then
@@ -56,58 +103,164 @@ safe_rm() {
     fi
 }
 
-# 2️⃣ Clone/refresh 'startup' repo
-safe_rm startup
-echo "Cloning repository..."
-git clone https://github.com/Abr-ahamis/startup.git || echo "⚠️ git clone failed, proceeding."
+# Helper: Hardlink a directory tree into dest_dir, or copy it if dest_dir is on another filesystem
+link_tree() {
+    local src="$1" dest_dir="$2"
+    sudo cp -al "$src" "$dest_dir" 2>/dev/null || {
+        safe_rm "$dest_dir/$(basename "$src")"
+        sudo cp -r --reflink=auto "$src" "$dest_dir"
+    }
+}
+
+# 2️⃣ Clone/refresh 'startup' repo (reuse an existing checkout; STARTUP_OFFLINE=1 skips the network)
+if [ -d startup/.git ]; then
+    if [ "${STARTUP_OFFLINE:-0}" != 1 ]; then
+        echo "Refreshing repository..."
+        { git -C startup fetch -q --depth=1 origin HEAD && git -C startup reset -q --hard FETCH_HEAD; } \
+            || echo "⚠️ git refresh failed, using existing checkout."
+    fi
+else
+    safe_rm startup
+    echo "Cloning repository..."
+    git clone --depth=1 --single-branch https://github.com/Abr-ahamis/startup.git || echo "⚠️ git clone failed, proceeding."
+fi
 cd startup || { echo "❌ Cannot cd into 'startup'"; }
 
 # 3️⃣ Apply GRUB themes
+# /boot gets a real root-owned copy (never linked to the user's checkout);
+# /usr/share then hardlinks that copy when both are on the same filesystem
 safe_rm /boot/grub/themes/kali
-sudo cp -r kali /boot/grub/themes || echo "⚠️ grub theme copy failed."
+sudo cp -r --reflink=auto kali /boot/grub/themes || echo "⚠️ grub theme copy failed."
 
 safe_rm /usr/share/grub/themes/kali
-sudo cp -r /boot/grub/themes/kali /usr/share/grub/themes || echo "⚠️ grub theme copy failed."
+link_tree /boot/grub/themes/kali /usr/share/grub/themes || echo "⚠️ grub theme copy failed."
 
 # 4️⃣ Apply wallpapers
 cd wallpaper || echo "⚠️ Cannot cd into wallpaper folder."
 
-for img in kali-maze-16x9.jpg kali-tiles-16x9.jpg kali-oleo-16x9.png kali-tiles-purple-16x9.jpg kali-waves-16x9.png login.svg login-blurred; do
-    sudo mv "/usr/share/backgrounds/kali/$img" "/usr/share/backgrounds/kali/${img}.b" 2>/dev/null || true
-done
+# All backups and copies run in one privileged shell instead of a sudo per file
+sudo bash -s <<'EOF' || echo "⚠️ wallpaper update failed."
+bg=/usr/share/backgrounds/kali
+# Back up the stock image as a hardlink (ln fails if a backup exists, so re-runs keep it),
+# then write the new one under a temp name and rename it over the original: no data is
+# moved for the backup and the wallpaper path never goes missing.
+put() {
+    ln "$bg/$2" "$bg/$2.b" 2>/dev/null || true
+    cp --reflink=auto "$1" "$bg/.$2.new" && mv -f "$bg/.$2.new" "$bg/$2"
+}
 
-sudo cp 20-wallpaper.svg /usr/share/backgrounds/kali/login.svg || true
-sudo cp 12-wallpaper.png /usr/share/backgrounds/kali/kali-maze-16x9.jpg || true
-sudo cp 1-wallpaper.png /usr/share/backgrounds/kali/kali-tiles-16x9.jpg || true
-sudo cp 2-wallpaper.png /usr/share/backgrounds/kali/kali-waves-16x9.png || true
-sudo cp 3-wallpaper.png /usr/share/backgrounds/kali/kali-oleo-16x9.png || true
-sudo cp 4-wallpaper.png /usr/share/backgrounds/kali/kali-tiles-purple-16x9.jpg || true
-sudo cp 2-wallpaper.png /usr/share/backgrounds/kali/login-blurred || true
+# The entries touch different files, so let them run side by side
+put 20-wallpaper.svg login.svg &
+put 12-wallpaper.png kali-maze-16x9.jpg &
+put 1-wallpaper.png kali-tiles-16x9.jpg &
+put 2-wallpaper.png kali-waves-16x9.png &
+put 3-wallpaper.png kali-oleo-16x9.png &
+put 4-wallpaper.png kali-tiles-purple-16x9.jpg &
+put 2-wallpaper.png login-blurred &
+wait
+EOF
 
 # 5️⃣ GNOME Settings: Sleep, Interface, Dash-to-Dock
-echo "⏰ Setting 2-hour sleep timer (AC)..."
-gset set org.gnome.settings-daemon.plugins.power sleep-inactive-ac-timeout 7200 || true
-gset set org.gnome.settings-daemon.plugins.power sleep-inactive-ac-type 'suspend' || true
-
-echo "💠 Applying GNOME interface settings..."
-gset set org.gnome.desktop.interface font-name 'DejaVu Serif Condensed 10' || true
-gset set org.gnome.desktop.interface text-scaling-factor 0.95 || true
-gset set org.gnome.desktop.background picture-options 'zoom' || true
-
-echo "🅾 Configuring Dash-to-Dock..."
-gset set org.gnome.shell.extensions.dash-to-dock dock-position 'LEFT' || true
-gset set org.gnome.shell.extensions.dash-to-dock autohide true || true
-gset set org.gnome.shell.extensions.dash-to-dock animation-time 0.0 || true
-gset set org.gnome.shell.extensions.dash-to-dock hide-delay 0.0 || true
-gset set org.gnome.shell.extensions.dash-to-dock pressure-threshold 0.0 || true
-gset set org.gnome.shell.extensions.dash-to-dock dash-max-icon-size 20 || true
-
-# 6️⃣ Install Brave Nightly
-echo "🦁 Installing Brave Nightly..."
-{
-    curl -fsS https://dl.brave.com/install.sh | CHANNEL=nightly bash
-    sudo apt-get install -y brave-browser-nightly || echo "⚠️ Brave install failed."
-} || echo "⚠️ Brave setup script failed."
+echo "⏰ Setting 2-hour sleep timer (AC), 💠 GNOME interface and 🅾 Dash-to-Dock settings..."
+# One dconf load when the dconf CLI (dconf-cli) is available; per-key gsettings otherwise
+if ! command -v dconf >/dev/null 2>&1 || ! dconf_load <<'EOF'
+[org/gnome/settings-daemon/plugins/power]
+sleep-inactive-ac-timeout=7200
+sleep-inactive-ac-type='suspend'
+
+[org/gnome/desktop/interface]
+font-name='DejaVu Serif Condensed 10'
+text-scaling-factor=0.95
+
+[org/gnome/desktop/background]
+picture-options='zoom'
+
+[org/gnome/shell/extensions/dash-to-dock]
+dock-position='LEFT'
+autohide=true
+animation-time=0.0
+hide-delay=0.0
+pressure-threshold=0.0
+dash-max-icon-size=20
+EOF
+then
+    echo "⚠️ dconf load unavailable or failed, applying settings one by one..."
+    gset set org.gnome.settings-daemon.plugins.power sleep-inactive-ac-timeout 7200 || true
+    gset set org.gnome.settings-daemon.plugins.power sleep-inactive-ac-type 'suspend' || true
+    gset set org.gnome.desktop.interface font-name 'DejaVu Serif Condensed 10' || true
+    gset set org.gnome.desktop.interface text-scaling-factor 0.95 || true
+    gset set org.gnome.desktop.background picture-options 'zoom' || true
+    gset set org.gnome.shell.extensions.dash-to-dock dock-position 'LEFT' || true
+    gset set org.gnome.shell.extensions.dash-to-dock autohide true || true
+    gset set org.gnome.shell.extensions.dash-to-dock animation-time 0.0 || true
+    gset set org.gnome.shell.extensions.dash-to-dock hide-delay 0.0 || true
+    gset set org.gnome.shell.extensions.dash-to-dock pressure-threshold 0.0 || true
+    gset set org.gnome.shell.extensions.dash-to-dock dash-max-icon-size 20 || true
+fi
+
+# 6️⃣ Add the Brave Nightly and ProtonVPN repositories now, so a single apt update
+#    (run in the background while Telegram finishes) covers both
+echo "🦁 Adding Brave Nightly and 🔐 ProtonVPN repositories..."
+if [ -n "${DL_PIDS[brave]:-}" ] && fetch_wait brave; then
+    sudo install -m 644 "$DL_DIR/brave-nightly-keyring.gpg" /usr/share/keyrings/brave-browser-nightly-archive-keyring.gpg
+    echo "deb [signed-by=/usr/share/keyrings/brave-browser-nightly-archive-keyring.gpg] https://brave-browser-apt-nightly.s3.brave.com/ stable main" \
+        | sudo tee /etc/apt/sources.list.d/brave-browser-nightly.list >/dev/null
+fi
+if [ -n "${DL_PIDS[protonvpn]:-}" ]; then
+    fetch_wait protonvpn || true
+    sudo dpkg -i "$DL_DIR/protonvpn.deb" || true
+fi
+sudo apt update &
+APT_UPDATE_PID=$!
+
+# 7️⃣ Installing Telegram...
+echo "📦 Waiting for Telegram download and extraction..."
+fetch_wait telegram
+
+## Make it executable
+sudo chmod +x /opt/Telegram/Telegram
+sudo touch /opt/Telegram/.startup-installed
+
+# Add symlink if not present
+if ! command -v telegram-desktop >/dev/null 2>&1; then
+    sudo ln -sf /opt/Telegram/Telegram /usr/local/bin/telegram-desktop
+fi
+
+#echo "🚀 Launching Telegram..."
+/opt/Telegram/Telegram >/dev/null 2>&1 &
+
+# 8️⃣ Install Brave, ProtonVPN, 9️⃣ RustScan, 10️⃣ VS Code, grub-customizer & timeshift in one apt transaction
+#    (local .debs included, so dependencies are resolved and triggers run only once)
+echo "🦁 Installing Brave, 🔐 ProtonVPN, 🔍 RustScan, 💻 VS Code, 🛠 grub-customizer and timeshift..."
+APT_PKGS=(proton-vpn-gnome-desktop libayatana-appindicator3-1 gir1.2-ayatanaappindicator3-0.1 gnome-shell-extension-appindicator
+    grub-customizer timeshift)
+if [ -f /etc/apt/sources.list.d/brave-browser-nightly.list ]; then
+    APT_PKGS+=(brave-browser-nightly)
+fi
+if [ -n "${DL_PIDS[rustscan]:-}" ]; then
+    if fetch_wait rustscan; then
+        APT_PKGS+=("$DL_DIR/rustscan_2.2.3_amd64.deb")
+    else
+        echo "⚠️ RustScan download failed, skipping."
+    fi
+fi
+if [ -n "${DL_PIDS[vscode]:-}" ]; then
+    if fetch_wait vscode; then
+        APT_PKGS+=("$DL_DIR/code.deb")
+    else
+        echo "⚠️ VS Code download failed, skipping."
+    fi
+fi
+wait "$APT_UPDATE_PID"
+sudo apt-get install -y "${APT_PKGS[@]}" || {
+    echo "⚠️ Combined install failed, installing packages one by one..."
+    for pkg in "${APT_PKGS[@]}"; do
+        sudo apt-get install -y "$pkg" || echo "⚠️ $pkg install failed."
+    done
+}
+ulimit -n 5000 || true
+nohup protonvpn-app >/dev/null 2>&1 &
+nohup code >/dev/null 2>&1 &
 
 # Pin Brave if available
 for entry in brave-browser.desktop brave-browser-nightly.desktop brave.desktop; do
@@ -118,39 +271,14 @@ for entry in brave-browser.desktop brave-browser-nightly.desktop brave.desktop;
 done
 if [ -n "${desktop:-}" ]; then
     favs=$(gset get org.gnome.shell favorite-apps) || favs=""
-    if [[ $favs != *"$desktop"* ]]; then
-        new=$(echo "$favs" | sed "s/]$/, '$desktop']/") || new="$favs"
+    if [ -n "$favs" ] && [[ $favs != *"'$desktop'"* ]]; then
+        case "$favs" in
+            *"[]") new="['$desktop']" ;;  # an empty list is printed as "@as []"
+            *) new="${favs%]}, '$desktop']" ;;
+        esac
         gset set org.gnome.shell favorite-apps "$new" || true
     fi
 fi
 
-
-# Install ProtonVPN
-echo "🔐 Installing ProtonVPN..."
-wget -q https://repo.protonvpn.com/debian/dists/stable/main/binary-all/protonvpn-stable-release_1.0.8_all.deb -O /tmp/protonvpn.deb || true
-sudo dpkg -i /tmp/protonvpn.deb || true
-sudo apt update
-sudo apt install -y proton-vpn-gnome-desktop libayatana-appindicator3-1 gir1.2-ayatanaappindicator3-0.1 gnome-shell-extension-appindicator || true
-nohup protonvpn-app >/dev/null 2>&1 || true
-
-# 9️⃣ Install RustScan
-echo "🔍 Installing RustScan..."
-cd /tmp
-wget -q https://github.com/RustScan/RustScan/releases/download/2.2.3/rustscan_2.2.3_amd64.deb || true
-sudo dpkg -i rustscan_2.2.3_amd64.deb || sudo apt-get install -f -y || true
-ulimit -n 5000 || true
-
-# 10️⃣ Install VS Code
-echo "💻 Installing Visual Studio Code..."
-cd /tmp
-wget -q "https://code.visualstudio.com/sha/download?build=stable&os=linux-deb-x64" -O code.deb || true
-sudo dpkg -i code.deb || sudo apt-get install -f -y || true
-rm -f code.deb || true
-nohup code >/dev/null 2>&1 || true
-
-# 11️⃣ Install grub-customizer & timeshift
-echo "🛠 Installing grub-customizer and timeshift..."
-sudo apt-get install -y grub-customizer timeshift || true
-
 echo "=== All tasks completed. Have a good day! ==="
                  